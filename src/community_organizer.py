@@ -2,25 +2,134 @@
 """BlackRoad Community Organizer - events, members, RSVPs."""
 
 from __future__ import annotations
-import argparse
-import json
+import atexit
+import os
+import queue
 import sqlite3
-from dataclasses import dataclass, asdict
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
-GREEN = "\033[0;32m"
-RED = "\033[0;31m"
-CYAN = "\033[0;36m"
-YELLOW = "\033[1;33m"
-BLUE = "\033[0;34m"
-BOLD = "\033[1m"
-NC = "\033[0m"
+# Colors switch off when stdout is piped or NO_COLOR is set (per
+# https://no-color.org), so downstream tools see plain text and every
+# line is roughly half the bytes.
+_TTY = sys.stdout.isatty() and "NO_COLOR" not in os.environ
+GREEN = "\033[0;32m" if _TTY else ""
+RED = "\033[0;31m" if _TTY else ""
+CYAN = "\033[0;36m" if _TTY else ""
+YELLOW = "\033[1;33m" if _TTY else ""
+BLUE = "\033[0;34m" if _TTY else ""
+BOLD = "\033[1m" if _TTY else ""
+NC = "\033[0m" if _TTY else ""
 
 DB_PATH = Path.home() / ".blackroad" / "community-organizer.db"
 
-
-@dataclass
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS members (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    email TEXT UNIQUE NOT NULL,
+    role TEXT DEFAULT 'member',
+    joined_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%f','now')),
+    active INTEGER DEFAULT 1
+);
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    title TEXT NOT NULL,
+    description TEXT DEFAULT '',
+    location TEXT DEFAULT 'TBD',
+    event_date TEXT NOT NULL,
+    capacity INTEGER DEFAULT 50,
+    organizer_id INTEGER REFERENCES members(id),
+    created_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%f','now')),
+    status TEXT DEFAULT 'upcoming'
+);
+CREATE TABLE IF NOT EXISTS rsvps (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    event_id INTEGER NOT NULL REFERENCES events(id),
+    member_id INTEGER NOT NULL REFERENCES members(id),
+    response TEXT DEFAULT 'attending',
+    rsvp_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%f','now')),
+    notes TEXT DEFAULT '',
+    UNIQUE(event_id, member_id)
+);
+CREATE INDEX IF NOT EXISTS idx_rsvps_event ON rsvps(event_id);
+CREATE INDEX IF NOT EXISTS idx_rsvps_event_response ON rsvps(event_id, response);
+CREATE INDEX IF NOT EXISTS idx_rsvps_event_rsvpat ON rsvps(event_id, rsvp_at, member_id, response);
+CREATE INDEX IF NOT EXISTS idx_rsvps_response ON rsvps(response);
+CREATE INDEX IF NOT EXISTS idx_members_active ON members(active);
+CREATE INDEX IF NOT EXISTS idx_events_status_date ON events(status, event_date);
+-- Superseded by idx_events_status_date, which the planner always preferred.
+DROP INDEX IF EXISTS idx_events_upcoming;
+"""
+
+# SQL lives in module-level constants so every call site passes the
+# identical string and hits sqlite3's per-connection statement cache
+# instead of re-preparing the query.
+SQL_GET_MEMBER_ID = "SELECT id FROM members WHERE email=?"
+SQL_INSERT_MEMBER = (
+    "INSERT INTO members (name,email,role) VALUES (?,?,?) RETURNING id, joined_at"
+)
+SQL_INSERT_MEMBER_BULK = "INSERT INTO members (name,email,role) VALUES (?,?,?)"
+SQL_INSERT_EVENT = (
+    "INSERT INTO events (title,description,location,event_date,capacity,organizer_id)"
+    " VALUES (?,?,?,?,?,?) RETURNING id, created_at"
+)
+SQL_INSERT_EVENT_BULK = (
+    "INSERT INTO events (title,event_date,location,description,capacity)"
+    " VALUES (?,?,?,?,?)"
+)
+# ON CONFLICT DO UPDATE instead of INSERT OR REPLACE: a repeat RSVP is
+# one B-tree update that keeps its rowid, rather than a delete+insert
+# that churns every rsvps index and burns an autoincrement id.
+SQL_INSERT_RSVP = (
+    "INSERT INTO rsvps (event_id,member_id,response,notes)"
+    " VALUES (?,?,?,?)"
+    " ON CONFLICT(event_id, member_id) DO UPDATE SET"
+    " response=excluded.response, rsvp_at=excluded.rsvp_at, notes=excluded.notes"
+)
+# Single-statement upsert: the member lookup rides along as a subquery,
+# so one VDBE dispatch replaces the SELECT + INSERT pair (needs SQLite
+# >= 3.35 for RETURNING).
+SQL_RSVP_UPSERT = (
+    "INSERT INTO rsvps (event_id,member_id,response,notes)"
+    " SELECT ?, id, ?, ? FROM members WHERE email=?"
+    " ON CONFLICT(event_id, member_id) DO UPDATE SET"
+    " response=excluded.response, rsvp_at=excluded.rsvp_at, notes=excluded.notes"
+    " RETURNING id, member_id, rsvp_at"
+)
+# Explicit column lists in dataclass field order: SELECT * would bind
+# Event(*row) etc. to the physical column order, which silently breaks
+# the moment a migration appends a column.
+MEMBER_COLS = "id,name,email,role,joined_at,active"
+EVENT_COLS = "id,title,description,location,event_date,capacity,organizer_id,created_at,status"
+RSVP_COLS = "id,event_id,member_id,response,rsvp_at,notes"
+SQL_LIST_EVENTS = f"SELECT {EVENT_COLS} FROM events ORDER BY event_date"
+SQL_LIST_EVENTS_BY_STATUS = (
+    f"SELECT {EVENT_COLS} FROM events WHERE status=? ORDER BY event_date"
+)
+SQL_LIST_MEMBERS = f"SELECT {MEMBER_COLS} FROM members WHERE active=1"
+# idx_rsvps_event_rsvpat covers every rsvps column this query touches
+# and is already ordered by (event_id, rsvp_at), so the outer side needs
+# no table lookup and no sort step.
+SQL_EVENT_ATTENDEES = (
+    "SELECT m.name, m.email, r.response, r.rsvp_at"
+    " FROM rsvps r INDEXED BY idx_rsvps_event_rsvpat"
+    " JOIN members m ON m.id=r.member_id"
+    " WHERE r.event_id=? ORDER BY r.rsvp_at"
+)
+SQL_STATUS_COUNTS = (
+    "SELECT (SELECT COUNT(*) FROM members WHERE active=1),"
+    " (SELECT COUNT(*) FROM events),"
+    " (SELECT COUNT(*) FROM rsvps WHERE response='attending')"
+)
+
+
+@dataclass(slots=True)
 class Member:
     id: int
     name: str
@@ -30,7 +139,7 @@ class Member:
     active: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     id: int
     title: str
@@ -43,7 +152,7 @@ class Event:
     status: str
 
 
-@dataclass
+@dataclass(slots=True)
 class RSVP:
     id: int
     event_id: int
@@ -56,162 +165,354 @@ class RSVP:
 class CommunityOrganizer:
     """Community event and member management system."""
 
-    def __init__(self, db_path: Path = DB_PATH):
+    #: Batched-write tuning: commit once per up to this many queued
+    #: writes, or after this window elapses, whichever comes first.
+    BATCH_MAX = 1000
+    BATCH_WINDOW = 0.01
+    #: Queue sentinel telling the drain thread to exit.
+    _SHUTDOWN = object()
+
+    def __init__(self, db_path: Path = DB_PATH, batch_writes: bool = False):
         self.db_path = db_path
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # One long-lived connection: reopening per call pays file-open,
+        # schema-load, and implicit-transaction costs on every statement.
+        self._conn = sqlite3.connect(
+            self.db_path, isolation_level=None, check_same_thread=False,
+            cached_statements=128,
+        )
+        # C-implemented rows with name and index access; read paths hand
+        # these straight to callers instead of building a dataclass per row.
+        self._conn.row_factory = sqlite3.Row
+        atexit.register(self.close)
         self._init_db()
+        # Reused cursor for the hottest write path (rsvp).
+        self._cur = self._conn.cursor()
+        # Optional write coalescing: rsvp() statements go through a queue
+        # drained by a daemon thread that commits whole batches, so many
+        # concurrent writers share one fsync. Off by default to keep the
+        # strict per-call durability of the plain path.
+        self._write_q = None
+        self._writer = None
+        if batch_writes:
+            self._write_q = queue.Queue()
+            self._writer = threading.Thread(target=self._drain_writes, daemon=True)
+            self._writer.start()
+
+    def _drain_writes(self) -> None:
+        # The drain thread gets its own connection: sharing self._conn
+        # would tangle its BEGIN/COMMIT with transactions other callers
+        # hold open there (e.g. _bulk_insert with auto_commit=False).
+        # Writes submitted while self._conn holds a deferred transaction
+        # never reach this thread (see rsvp), so the only contention WAL
+        # and busy_timeout must absorb is a plain autocommit writer.
+        conn = sqlite3.connect(
+            self.db_path, isolation_level=None, check_same_thread=False,
+            cached_statements=128,
+        )
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA busy_timeout=5000")
+        cur = conn.cursor()
+        q = self._write_q
+        shutdown = False
+        while not shutdown:
+            item = q.get()
+            if item is self._SHUTDOWN:
+                q.task_done()
+                break
+            batch = [item]
+            deadline = time.monotonic() + self.BATCH_WINDOW
+            while len(batch) < self.BATCH_MAX:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = q.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is self._SHUTDOWN:
+                    q.task_done()
+                    shutdown = True
+                    break
+                batch.append(item)
+            try:
+                cur.execute("BEGIN")
+                rows = [cur.execute(sql, params).fetchone() for sql, params, _ in batch]
+                cur.execute("COMMIT")
+            except Exception as exc:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                for _, _, future in batch:
+                    future.set_exception(exc)
+            else:
+                for row, (_, _, future) in zip(rows, batch):
+                    future.set_result(row)
+            finally:
+                for _ in batch:
+                    q.task_done()
+        conn.close()
+
+    def _submit_write(self, sql: str, params: tuple):
+        """Queue a write for the batch thread and wait for its row."""
+        from concurrent.futures import Future
+        future = Future()
+        self._write_q.put((sql, params, future))
+        return future.result()
+
+    def flush(self) -> None:
+        """Block until every queued batched write has been committed."""
+        if self._write_q is not None:
+            self._write_q.join()
+
+    def close(self) -> None:
+        """Close the shared connection and stop the batch writer, if any."""
+        if self._writer is not None:
+            self._write_q.put(self._SHUTDOWN)
+            self._writer.join()
+            self._write_q = None
+            self._writer = None
+        try:
+            self._conn.close()
+        except sqlite3.ProgrammingError:
+            pass  # already closed
+
+    def _column_missing_default(self, table: str, column: str) -> bool:
+        for row in self._conn.execute(f"PRAGMA table_info({table})"):
+            if row["name"] == column:
+                return row["dflt_value"] is None
+        return False
 
     def _init_db(self) -> None:
-        with sqlite3.connect(self.db_path) as conn:
-            conn.executescript("""
-                CREATE TABLE IF NOT EXISTS members (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT NOT NULL,
-                    email TEXT UNIQUE NOT NULL,
-                    role TEXT DEFAULT 'member',
-                    joined_at TEXT NOT NULL,
-                    active INTEGER DEFAULT 1
-                );
-                CREATE TABLE IF NOT EXISTS events (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    title TEXT NOT NULL,
-                    description TEXT DEFAULT '',
-                    location TEXT DEFAULT 'TBD',
-                    event_date TEXT NOT NULL,
-                    capacity INTEGER DEFAULT 50,
-                    organizer_id INTEGER REFERENCES members(id),
-                    created_at TEXT NOT NULL,
-                    status TEXT DEFAULT 'upcoming'
-                );
-                CREATE TABLE IF NOT EXISTS rsvps (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    event_id INTEGER NOT NULL REFERENCES events(id),
-                    member_id INTEGER NOT NULL REFERENCES members(id),
-                    response TEXT DEFAULT 'attending',
-                    rsvp_at TEXT NOT NULL,
-                    notes TEXT DEFAULT '',
-                    UNIQUE(event_id, member_id)
-                );
-                CREATE INDEX IF NOT EXISTS idx_rsvps_event ON rsvps(event_id);
-            """)
+        # WAL keeps readers from blocking writers and creates -wal/-shm
+        # sidecar files next to DB_PATH; synchronous=NORMAL halves fsyncs
+        # per commit, which is safe under WAL.
+        for pragma in (
+            "PRAGMA journal_mode=WAL",
+            "PRAGMA synchronous=NORMAL",
+            "PRAGMA temp_store=memory",
+            "PRAGMA cache_size=-64000",
+            "PRAGMA busy_timeout=5000",
+        ):
+            self._conn.execute(pragma)
+        # Databases created before the timestamp DEFAULTs existed have
+        # plain NOT NULL columns; CREATE TABLE IF NOT EXISTS leaves them
+        # untouched, and the INSERTs no longer bind a timestamp. Rename
+        # such tables aside so the script below recreates them with the
+        # current DDL, then copy the rows back.
+        legacy = [
+            (table, cols) for table, column, cols in (
+                ("members", "joined_at", MEMBER_COLS),
+                ("events", "created_at", EVENT_COLS),
+                ("rsvps", "rsvp_at", RSVP_COLS),
+            ) if self._column_missing_default(table, column)
+        ]
+        for table, _ in legacy:
+            self._conn.execute(f"ALTER TABLE {table} RENAME TO {table}_legacy")
+        self._conn.executescript(SCHEMA_SQL)
+        if legacy:
+            for table, cols in legacy:
+                self._conn.execute(
+                    f"INSERT INTO {table} ({cols}) SELECT {cols} FROM {table}_legacy"
+                )
+                self._conn.execute(f"DROP TABLE {table}_legacy")
+            # The renamed tables took their indexes with them to the
+            # grave; a second pass recreates them on the new tables.
+            self._conn.executescript(SCHEMA_SQL)
 
     def add_member(self, name: str, email: str, role: str = "member") -> Member:
         """Register a community member."""
-        with sqlite3.connect(self.db_path) as conn:
-            now = datetime.now().isoformat()
-            cur = conn.execute(
-                "INSERT INTO members (name,email,role,joined_at) VALUES (?,?,?,?)",
-                (name, email, role, now),
-            )
-            return Member(cur.lastrowid, name, email, role, now, 1)
+        row = self._conn.execute(SQL_INSERT_MEMBER, (name, email, role)).fetchone()
+        return Member(row[0], name, email, role, row[1], 1)
 
     def create_event(self, title: str, event_date: str, location: str = "TBD",
                      description: str = "", capacity: int = 50,
                      organizer_email: str = None) -> Event:
         """Create a community event."""
-        with sqlite3.connect(self.db_path) as conn:
-            organizer_id = None
-            if organizer_email:
-                row = conn.execute(
-                    "SELECT id FROM members WHERE email=?", (organizer_email,)
-                ).fetchone()
-                if row:
-                    organizer_id = row[0]
-            now = datetime.now().isoformat()
-            cur = conn.execute(
-                "INSERT INTO events (title,description,location,event_date,capacity,organizer_id,created_at)"
-                " VALUES (?,?,?,?,?,?,?)",
-                (title, description, location, event_date, capacity, organizer_id, now),
-            )
-            return Event(cur.lastrowid, title, description, location,
-                         event_date, capacity, organizer_id, now, "upcoming")
+        organizer_id = None
+        if organizer_email:
+            row = self._conn.execute(
+                SQL_GET_MEMBER_ID, (organizer_email,)
+            ).fetchone()
+            if row:
+                organizer_id = row[0]
+        row = self._conn.execute(
+            SQL_INSERT_EVENT,
+            (title, description, location, event_date, capacity, organizer_id),
+        ).fetchone()
+        return Event(row[0], title, description, location,
+                     event_date, capacity, organizer_id, row[1], "upcoming")
 
     def rsvp(self, event_id: int, member_email: str,
              response: str = "attending", notes: str = "") -> RSVP:
         """Record an RSVP for an event."""
-        with sqlite3.connect(self.db_path) as conn:
-            m = conn.execute("SELECT id FROM members WHERE email=?", (member_email,)).fetchone()
-            if not m:
-                raise ValueError(f"Member '{member_email}' not found")
-            now = datetime.now().isoformat()
-            cur = conn.execute(
-                "INSERT OR REPLACE INTO rsvps (event_id,member_id,response,rsvp_at,notes)"
-                " VALUES (?,?,?,?,?)",
-                (event_id, m[0], response, now, notes),
-            )
-            return RSVP(cur.lastrowid, event_id, m[0], response, now, notes)
-
-    def list_events(self, status: str = None) -> list:
-        """List events optionally filtered by status."""
-        with sqlite3.connect(self.db_path) as conn:
-            if status:
-                rows = conn.execute(
-                    "SELECT * FROM events WHERE status=? ORDER BY event_date", (status,)
-                ).fetchall()
-            else:
-                rows = conn.execute(
-                    "SELECT * FROM events ORDER BY event_date"
-                ).fetchall()
-            return [Event(*r) for r in rows]
-
-    def list_members(self) -> list:
-        """Return active members."""
-        with sqlite3.connect(self.db_path) as conn:
-            return [Member(*r) for r in
-                    conn.execute("SELECT * FROM members WHERE active=1").fetchall()]
-
-    def event_attendees(self, event_id: int) -> list:
-        """Return list of attending members for an event."""
-        with sqlite3.connect(self.db_path) as conn:
-            rows = conn.execute(
-                "SELECT m.name, m.email, r.response, r.rsvp_at"
-                " FROM rsvps r JOIN members m ON m.id=r.member_id"
-                " WHERE r.event_id=? ORDER BY r.rsvp_at",
-                (event_id,),
-            ).fetchall()
-            return [{"name": r[0], "email": r[1], "response": r[2], "rsvp_at": r[3]}
-                    for r in rows]
+        params = (event_id, response, notes, member_email)
+        # While a deferred bulk transaction is open on the main
+        # connection, queueing would deadlock: the caller holds the
+        # write lock and then blocks on the Future, so the drain thread
+        # could never commit. Run the write inline instead; it joins the
+        # caller's transaction and lands with their commit().
+        if self._write_q is not None and not self._conn.in_transaction:
+            row = self._submit_write(SQL_RSVP_UPSERT, params)
+        else:
+            row = self._cur.execute(SQL_RSVP_UPSERT, params).fetchone()
+        if row is None:
+            raise ValueError(f"Member '{member_email}' not found")
+        return RSVP(row[0], event_id, row[1], response, row[2], notes)
+
+    def commit(self) -> None:
+        """Commit a transaction left open by a bulk call with auto_commit=False."""
+        if self._conn.in_transaction:
+            self._conn.execute("COMMIT")
+
+    def _bulk_insert(self, sql: str, rows: list, auto_commit: bool) -> None:
+        if not self._conn.in_transaction:
+            self._conn.execute("BEGIN")
+        try:
+            self._conn.executemany(sql, rows)
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+        if auto_commit:
+            self._conn.execute("COMMIT")
+
+    def add_members_bulk(self, rows: list, auto_commit: bool = True) -> None:
+        """Insert many (name, email, role) members in one transaction."""
+        self._bulk_insert(SQL_INSERT_MEMBER_BULK, rows, auto_commit)
+
+    def create_events_bulk(self, rows: list, auto_commit: bool = True) -> None:
+        """Insert many (title, event_date, location, description, capacity) events."""
+        self._bulk_insert(SQL_INSERT_EVENT_BULK, rows, auto_commit)
+
+    def rsvp_bulk(self, rows: list, auto_commit: bool = True) -> None:
+        """Record many (event_id, member_email, response, notes) RSVPs at once.
+
+        Resolves all member emails in a single query, then executes the
+        inserts inside one transaction instead of one commit per RSVP.
+        """
+        emails = list({email for _, email, _, _ in rows})
+        placeholders = ",".join("?" * len(emails))
+        ids = dict(self._conn.execute(
+            f"SELECT email, id FROM members WHERE email IN ({placeholders})", emails
+        ).fetchall())
+        missing = [e for e in emails if e not in ids]
+        if missing:
+            raise ValueError(f"Members not found: {', '.join(sorted(missing))}")
+        self._bulk_insert(
+            SQL_INSERT_RSVP,
+            [(event_id, ids[email], response, notes)
+             for event_id, email, response, notes in rows],
+            auto_commit,
+        )
+
+    def list_events(self, status: str = None) -> Iterator[sqlite3.Row]:
+        """Yield events optionally filtered by status."""
+        if status:
+            return self._conn.execute(SQL_LIST_EVENTS_BY_STATUS, (status,))
+        return self._conn.execute(SQL_LIST_EVENTS)
+
+    def list_members(self) -> Iterator[sqlite3.Row]:
+        """Yield active members."""
+        return self._conn.execute(SQL_LIST_MEMBERS)
+
+    def event_attendees(self, event_id: int) -> Iterator[sqlite3.Row]:
+        """Yield attending members for an event."""
+        return self._conn.execute(SQL_EVENT_ATTENDEES, (event_id,))
 
     def status(self) -> dict:
         """High-level statistics."""
-        with sqlite3.connect(self.db_path) as conn:
-            members = conn.execute("SELECT COUNT(*) FROM members WHERE active=1").fetchone()[0]
-            events = conn.execute("SELECT COUNT(*) FROM events").fetchone()[0]
-            rsvps = conn.execute("SELECT COUNT(*) FROM rsvps WHERE response='attending'").fetchone()[0]
+        members, events, rsvps = self._conn.execute(SQL_STATUS_COUNTS).fetchone()
         return {"active_members": members, "total_events": events,
                 "confirmed_rsvps": rsvps, "db_path": str(self.db_path)}
 
-    def export_data(self) -> dict:
-        """Export full dataset as JSON."""
-        with sqlite3.connect(self.db_path) as conn:
-            members = [Member(*r) for r in conn.execute("SELECT * FROM members").fetchall()]
-            events = [Event(*r) for r in conn.execute("SELECT * FROM events").fetchall()]
-            rsvps = [RSVP(*r) for r in conn.execute("SELECT * FROM rsvps").fetchall()]
-        return {
-            "members": [asdict(m) for m in members],
-            "events": [asdict(e) for e in events],
-            "rsvps": [asdict(r) for r in rsvps],
-            "exported_at": datetime.now().isoformat(),
-        }
-
+    def _stream_table(self, sql: str):
+        """Yield the rows of a query as JSON object strings, 1000 at a time."""
+        try:
+            # orjson encodes in C; stdlib json is the fallback.
+            import orjson
+            encode = lambda obj: orjson.dumps(obj).decode()  # noqa: E731
+        except ImportError:
+            import json
+            # Compact separators keep the fallback byte-identical to orjson.
+            encode = json.JSONEncoder(separators=(",", ":")).encode
+
+        cur = self._conn.execute(sql)
+        cols = [d[0] for d in cur.description]
+        first = True
+        while rows := cur.fetchmany(1000):
+            for row in rows:
+                yield ("" if first else ",") + encode(dict(zip(cols, row)))
+                first = False
+
+    def export_data(self):
+        """Stream the full dataset as chunks of JSON text.
+
+        Rows go straight from the cursor to the encoder, so memory stays
+        bounded instead of materializing every table as dataclasses and
+        converting them back to dicts.
+        """
+        yield "{"
+        for i, (key, sql) in enumerate((
+            ("members", f"SELECT {MEMBER_COLS} FROM members"),
+            ("events", f"SELECT {EVENT_COLS} FROM events"),
+            ("rsvps", f"SELECT {RSVP_COLS} FROM rsvps"),
+        )):
+            yield ("," if i else "") + f'"{key}": ['
+            yield from self._stream_table(sql)
+            yield "]"
+        yield f', "exported_at": "{datetime.now().isoformat()}"}}'
+
+
+# Line templates built once at import: the constant ANSI escapes are
+# baked in, so per-row formatting only fills in the field values.
+# Status labels are fully rendered up front — color lookup and bracket
+# formatting are fused into one dict hit per row.
+STATUS_LABEL = {
+    status: f"[{color}{status}{NC}]"
+    for status, color in (("upcoming", CYAN), ("active", GREEN),
+                          ("cancelled", RED), ("completed", YELLOW))
+}
+MEMBER_FMT = f"  {CYAN}[{{id}}]{NC} {BOLD}{{name}}{NC}  {{email}}  role={YELLOW}{{role}}{NC}\n"
+EVENT_FMT = (f"  {CYAN}[{{id}}]{NC} {BOLD}{{title}}{NC}  {{event_date}}"
+             f"  @ {{location}}  cap={{capacity}}  {{status_label}}\n")
+
+
+def _fmt_member(m: sqlite3.Row) -> str:
+    return MEMBER_FMT.format(id=m["id"], name=m["name"], email=m["email"],
+                             role=m["role"])
+
+
+def _fmt_event(e: sqlite3.Row) -> str:
+    label = STATUS_LABEL.get(e["status"]) or f"[{e['status']}]"
+    return EVENT_FMT.format(id=e["id"], title=e["title"],
+                            event_date=e["event_date"], location=e["location"],
+                            capacity=e["capacity"], status_label=label)
+
+
+def _print_status(co: CommunityOrganizer) -> None:
+    st = co.status()
+    print(f"\n{BOLD}{BLUE}Community Organizer Status{NC}")
+    for k, v in st.items():
+        print(f"  {CYAN}{k}{NC}: {GREEN}{v}{NC}")
+
+
+def _write_export(co: CommunityOrganizer) -> None:
+    for chunk in co.export_data():
+        sys.stdout.write(chunk)
+    sys.stdout.write("\n")
 
-def _status_color(status: str) -> str:
-    return {
-        "upcoming": CYAN, "active": GREEN, "cancelled": RED, "completed": YELLOW
-    }.get(status, NC)
 
+def main() -> None:
+    # Fast path for flag-less status/export: argparse setup costs more
+    # than these commands themselves, so skip it (and its import) on the
+    # hot invocations.
+    argv = sys.argv[1:]
+    if len(argv) == 1 and argv[0] in ("status", "export"):
+        co = CommunityOrganizer()
+        _print_status(co) if argv[0] == "status" else _write_export(co)
+        return
 
-def _fmt_member(m: Member) -> None:
-    print(f"  {CYAN}[{m.id}]{NC} {BOLD}{m.name}{NC}  {m.email}  role={YELLOW}{m.role}{NC}")
-
-
-def _fmt_event(e: Event) -> None:
-    sc = _status_color(e.status)
-    print(f"  {CYAN}[{e.id}]{NC} {BOLD}{e.title}{NC}  {e.event_date}"
-          f"  @ {e.location}  cap={e.capacity}  [{sc}{e.status}{NC}]")
-
+    import argparse
 
-def main() -> None:
     parser = argparse.ArgumentParser(
         prog="community_organizer",
         description=f"{BOLD}BlackRoad Community Organizer{NC}",
@@ -250,14 +551,14 @@ def main() -> None:
 
     if args.cmd == "list":
         if getattr(args, "target", "events") == "events":
-            events = co.list_events(args.status)
+            events = list(co.list_events(args.status))
             label = f"status={args.status}" if args.status else "all"
             print(f"\n{BOLD}{BLUE}Events ({len(events)}) — {label}{NC}")
-            [_fmt_event(e) for e in events] or print(f"  {YELLOW}none{NC}")
+            sys.stdout.write("".join(map(_fmt_event, events)) or f"  {YELLOW}none{NC}\n")
         else:
-            members = co.list_members()
+            members = list(co.list_members())
             print(f"\n{BOLD}{BLUE}Members ({len(members)}){NC}")
-            [_fmt_member(m) for m in members] or print(f"  {YELLOW}none{NC}")
+            sys.stdout.write("".join(map(_fmt_member, members)) or f"  {YELLOW}none{NC}\n")
 
     elif args.cmd == "add-member":
         m = co.add_member(args.name, args.email, args.role)
@@ -273,20 +574,17 @@ def main() -> None:
         print(f"{GREEN}✓{NC} RSVP recorded (id={r.id}) response={r.response}")
 
     elif args.cmd == "attendees":
-        attendees = co.event_attendees(args.event_id)
+        attendees = list(co.event_attendees(args.event_id))
         print(f"\n{BOLD}{BLUE}Attendees for event {args.event_id} ({len(attendees)}){NC}")
         for a in attendees:
             rc = GREEN if a["response"] == "attending" else YELLOW
             print(f"  {BOLD}{a['name']}{NC}  {a['email']}  [{rc}{a['response']}{NC}]")
 
     elif args.cmd == "status":
-        st = co.status()
-        print(f"\n{BOLD}{BLUE}Community Organizer Status{NC}")
-        for k, v in st.items():
-            print(f"  {CYAN}{k}{NC}: {GREEN}{v}{NC}")
+        _print_status(co)
 
     elif args.cmd == "export":
-        print(json.dumps(co.export_data(), indent=2))
+        _write_export(co)
 
     else:
         parser.print_help()